@@ -0,0 +1,55 @@
+"""Loan list queries that build API responses straight from SQL rows."""
+
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import ColumnElement
+from sqlalchemy.orm import Mapped
+from sqlmodel import Session, col, desc, func
+from sqlmodel.sql.expression import Select
+
+from app.models import Loan, LoanResponse, LoanStatus
+
+# to_char patterns matching datetime.isoformat(timespec="microseconds") for timestamptz and naive timestamp columns
+_ISO_TIMESTAMPTZ = 'YYYY-MM-DD"T"HH24:MI:SS.USTZH:TZM'
+_ISO_TIMESTAMP = 'YYYY-MM-DD"T"HH24:MI:SS.US'
+
+
+def _iso(column: Mapped[datetime], pattern: str, name: str) -> ColumnElement[str]:
+    return func.to_char(column, pattern).label(name)
+
+
+def list_loan_responses(
+    session: Session,
+    lab_id: Optional[uuid.UUID] = None,
+    status: Optional[LoanStatus] = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> List[LoanResponse]:
+    """Newest loans first, with timestamps formatted by PostgreSQL instead of per row in Python."""
+    # sqlmodel's select() is only typed for up to four columns, so build the Select directly
+    query: Select[Any] = Select(
+        col(Loan.id),
+        col(Loan.equipment_id),
+        col(Loan.borrower_id),
+        col(Loan.supervisor_id),
+        col(Loan.lab_id),
+        _iso(col(Loan.start_time), _ISO_TIMESTAMP, "start_time"),
+        _iso(col(Loan.end_time), _ISO_TIMESTAMP, "end_time"),
+        col(Loan.purpose),
+        col(Loan.course),
+        col(Loan.project),
+        col(Loan.status),
+        col(Loan.late_minutes),
+        _iso(col(Loan.created_at), _ISO_TIMESTAMPTZ, "created_at"),
+    )
+    if lab_id is not None:
+        query = query.where(col(Loan.lab_id) == lab_id)
+    if status is not None:
+        query = query.where(col(Loan.status) == status)
+    # UUIDv7 ids are time-ordered, so the primary key index serves "newest first" without a sort
+    query = query.order_by(desc(col(Loan.id))).limit(limit).offset(offset)
+
+    # Rows already match the response schema, so skip validation
+    return [LoanResponse.model_construct(**row._mapping) for row in session.exec(query)]
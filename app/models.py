@@ -1,10 +1,93 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
-from sqlalchemy import DateTime, func
-from datetime import datetime, date
+from sqlmodel import SQLModel, Field, Relationship, Column
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    CheckConstraint,
+    DateTime,
+    Enum as SAEnum,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    TypeDecorator,
+    event,
+    Text,
+    column,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import INET, JSONB, ExcludeConstraint
+from sqlalchemy.engine import Dialect
+from pydantic import ConfigDict, IPvAnyAddress, TypeAdapter
+from datetime import datetime, date, timezone
 from typing import Optional, List, Dict, Any
 from enum import Enum
+import ipaddress
+import os
+import time
 import uuid
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
+
+
+def _uuid7() -> uuid.UUID:
+    """Time-ordered UUIDv7 (RFC 9562): 48-bit Unix ms timestamp followed by random bits.
+
+    Keeps primary key inserts appending to the end of the B-tree index instead of
+    scattering across it like UUIDv4 does.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    # Set version (0b0111) and RFC 4122 variant (0b10) bits
+    value = (value & ~(0xF << 76) & ~(0b11 << 62)) | (0x7 << 76) | (0b10 << 62)
+    return uuid.UUID(int=value)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class _Cents(TypeDecorator[Decimal]):
+    """Money amount exposed as a two-place Decimal but stored as integer cents in a BIGINT *_cents column.
+
+    Loading an ORM object still builds one Decimal per non-null amount; queries that aggregate or list
+    many rows should select the *_cents column and convert once.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[Decimal], dialect: Dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return int(Decimal(value).scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+    def process_result_value(self, value: Optional[int], dialect: Dialect) -> Optional[Decimal]:
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-2)
+
+
+class _IPAddress(TypeDecorator[ipaddress.IPv4Address | ipaddress.IPv6Address]):
+    """IPv4/IPv6 address stored in a PostgreSQL INET column."""
+
+    impl = INET
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return str(value)
+
+    def process_result_value(
+        self, value: Any, dialect: Dialect
+    ) -> Optional[ipaddress.IPv4Address | ipaddress.IPv6Address]:
+        if value is None:
+            return None
+        return ipaddress.ip_address(str(value))
+
+
+def _pg_enum(enum_cls: type[Enum], name: str) -> SAEnum:
+    """Native PostgreSQL ENUM type (4 bytes per value) whose labels are the Python enum values."""
+    return SAEnum(enum_cls, name=name, values_callable=lambda members: [member.value for member in members])
 
 
 # Enums for various status fields
@@ -53,205 +136,361 @@ class NotificationType(str, Enum):
 # Persistent models (stored in database)
 class User(SQLModel, table=True):
     __tablename__ = "users"  # type: ignore[assignment]
+    # Server-generated values (onupdate timestamps) come back via RETURNING on flush instead of being expired,
+    # so instances stay readable after commit in sessions with expire_on_commit=False
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, max_length=36)
+    id: Optional[uuid.UUID] = Field(default_factory=_uuid7, primary_key=True)
     name: str = Field(max_length=100)
     email: str = Field(unique=True, max_length=255, index=True)
-    role: UserRole = Field(index=True)
+    role: UserRole = Field(sa_column=Column(_pg_enum(UserRole, "user_role"), nullable=False, index=True))
     password_hash: str = Field(max_length=255)
     is_active: bool = Field(default=True, index=True)
     is_verified: bool = Field(default=False, index=True)
     npm: Optional[str] = Field(default=None, max_length=20, index=True)  # For mahasiswa
     nip: Optional[str] = Field(default=None, max_length=30, index=True)  # For staff
     phone: Optional[str] = Field(default=None, max_length=20)
-    lab_id: Optional[str] = Field(default=None, foreign_key="labs.id")
+    lab_id: Optional[uuid.UUID] = Field(default=None, foreign_key="labs.id")
     must_change_password: bool = Field(default=False)
-    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
-    updated_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
+    created_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
+    )
+    updated_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()),
+    )
 
     # Relationships
-    lab: Optional["Lab"] = Relationship(back_populates="laborans")
+    # Every relationship uses lazy="raise": query it explicitly or pass selectinload()/joinedload() to load it
+    lab: Optional["Lab"] = Relationship(
+        back_populates="laborans", sa_relationship_kwargs={"foreign_keys": "[User.lab_id]", "lazy": "raise"}
+    )
     loans_as_borrower: List["Loan"] = Relationship(
-        back_populates="borrower", sa_relationship_kwargs={"foreign_keys": "[Loan.borrower_id]"}
+        back_populates="borrower", sa_relationship_kwargs={"foreign_keys": "[Loan.borrower_id]", "lazy": "raise"}
     )
     loans_as_supervisor: List["Loan"] = Relationship(
-        back_populates="supervisor", sa_relationship_kwargs={"foreign_keys": "[Loan.supervisor_id]"}
+        back_populates="supervisor", sa_relationship_kwargs={"foreign_keys": "[Loan.supervisor_id]", "lazy": "raise"}
     )
-    notifications: List["Notification"] = Relationship(back_populates="user")
-    audit_logs: List["AuditLog"] = Relationship(back_populates="user")
-    training_certificates: List["TrainingCertificate"] = Relationship(back_populates="user")
+    notifications: List["Notification"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "raise"})
 
 
 class Lab(SQLModel, table=True):
     __tablename__ = "labs"  # type: ignore[assignment]
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, max_length=36)
+    id: Optional[uuid.UUID] = Field(default_factory=_uuid7, primary_key=True)
     code: str = Field(unique=True, max_length=10, index=True)
     name: str = Field(max_length=100)
     location: str = Field(max_length=200)
     capacity: int = Field(ge=1)
-    operating_hours: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    head_id: Optional[str] = Field(default=None, foreign_key="users.id")
+    operating_hours: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
+    # users.lab_id and labs.head_id reference each other; a named, separately added FK lets drop_all break the cycle
+    head_id: Optional[uuid.UUID] = Field(
+        default=None, sa_column_args=[ForeignKey("users.id", name="fk_labs_head_id", use_alter=True)]
+    )
     contact_person: str = Field(max_length=100)
     contact_email: str = Field(max_length=255)
     rules_pdf: Optional[str] = Field(default=None, max_length=500)  # File path
     sop_pdf: Optional[str] = Field(default=None, max_length=500)  # File path
-    gallery: List[str] = Field(default=[], sa_column=Column(JSON))  # Image paths
+    gallery: List[str] = Field(default=[], sa_column=Column(JSONB))  # Image paths
     description: str = Field(default="", max_length=2000)
-    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
-    updated_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
+    created_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
+    )
+    updated_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()),
+    )
 
     # Relationships
-    head: Optional["User"] = Relationship(sa_relationship_kwargs={"foreign_keys": "[Lab.head_id]", "post_update": True})
-    laborans: List["User"] = Relationship(back_populates="lab")
-    equipment: List["Equipment"] = Relationship(back_populates="lab")
-    loans: List["Loan"] = Relationship(back_populates="lab")
+    head: Optional["User"] = Relationship(
+        sa_relationship_kwargs={"foreign_keys": "[Lab.head_id]", "post_update": True, "lazy": "raise"}
+    )
+    laborans: List["User"] = Relationship(
+        back_populates="lab", sa_relationship_kwargs={"foreign_keys": "[User.lab_id]", "lazy": "raise"}
+    )
+    equipment: List["Equipment"] = Relationship(back_populates="lab", sa_relationship_kwargs={"lazy": "raise"})
+    loans: List["Loan"] = Relationship(back_populates="lab", sa_relationship_kwargs={"lazy": "raise"})
 
 
 class Equipment(SQLModel, table=True):
     __tablename__ = "equipment"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_equip_cal_due", "calibration_due_date"),
+        Index("ix_equip_available", "lab_id", postgresql_where=text("status = 'available'")),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, max_length=36)
-    lab_id: str = Field(foreign_key="labs.id", index=True)
+    id: Optional[uuid.UUID] = Field(default_factory=_uuid7, primary_key=True)
+    lab_id: uuid.UUID = Field(foreign_key="labs.id", index=True)
     code: str = Field(max_length=50, index=True)  # Unique per lab
     name: str = Field(max_length=200)
     brand: Optional[str] = Field(default=None, max_length=100)
     model: Optional[str] = Field(default=None, max_length=100)
     serial_no: Optional[str] = Field(default=None, max_length=100)
     image: Optional[str] = Field(default=None, max_length=500)  # Image path
-    specification: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    specification: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
     manual_pdf: Optional[str] = Field(default=None, max_length=500)  # File path
-    status: EquipmentStatus = Field(default=EquipmentStatus.available, index=True)
+    status: EquipmentStatus = Field(
+        default=EquipmentStatus.available,
+        sa_column=Column(_pg_enum(EquipmentStatus, "equipment_status"), nullable=False, index=True),
+    )
     needs_head_approval: bool = Field(default=False)
     calibration_due_date: Optional[date] = Field(default=None)
-    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
-    updated_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
+    created_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
+    )
+    updated_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()),
+    )
 
     # Relationships
-    lab: "Lab" = Relationship(back_populates="equipment")
-    loans: List["Loan"] = Relationship(back_populates="equipment")
-    maintenance_records: List["Maintenance"] = Relationship(back_populates="equipment")
-    training_certificates: List["TrainingCertificate"] = Relationship(back_populates="equipment")
+    lab: "Lab" = Relationship(back_populates="equipment", sa_relationship_kwargs={"lazy": "raise"})
+    loans: List["Loan"] = Relationship(back_populates="equipment", sa_relationship_kwargs={"lazy": "raise"})
+    maintenance_records: List["Maintenance"] = Relationship(
+        back_populates="equipment", sa_relationship_kwargs={"lazy": "raise"}
+    )
 
 
 class Loan(SQLModel, table=True):
     __tablename__ = "loans"  # type: ignore[assignment]
-
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, max_length=36)
-    equipment_id: str = Field(foreign_key="equipment.id", index=True)
-    borrower_id: str = Field(foreign_key="users.id", index=True)
-    supervisor_id: Optional[str] = Field(default=None, foreign_key="users.id")
-    lab_id: str = Field(foreign_key="labs.id", index=True)  # Denormalized
+    __table_args__ = (
+        Index("ix_loan_lab_status", "lab_id", "status"),
+        Index("ix_loan_equipment_time", "equipment_id", "start_time", "end_time"),
+        Index("ix_loan_borrower_status", "borrower_id", "status"),
+        Index("ix_loan_active", "lab_id", "end_time", postgresql_where=text("status IN ('approved', 'in_use')")),
+        CheckConstraint("end_time > start_time", name="ck_loan_time_order"),
+        # Double bookings of the same equipment are rejected by the insert itself (needs btree_gist, see below)
+        ExcludeConstraint(
+            (func.tsrange(column("start_time"), column("end_time"), "[)"), "&&"),
+            ("equipment_id", "="),
+            where=text("status IN ('approved', 'in_use')"),
+            using="gist",
+            name="loan_no_overlap",
+        ),
+    )
+    # Also returns lab_id, which the loans_sync_lab_id trigger sets
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[uuid.UUID] = Field(default_factory=_uuid7, primary_key=True)
+    equipment_id: uuid.UUID = Field(foreign_key="equipment.id")  # Indexed via ix_loan_equipment_time
+    borrower_id: uuid.UUID = Field(foreign_key="users.id")  # Indexed via ix_loan_borrower_status
+    supervisor_id: Optional[uuid.UUID] = Field(default=None, foreign_key="users.id")
+    # Denormalized copy of equipment.lab_id, maintained by the loans_sync_lab_id trigger below
+    lab_id: Optional[uuid.UUID] = Field(
+        default=None,
+        foreign_key="labs.id",
+        nullable=False,
+        sa_column_kwargs={"server_default": FetchedValue(), "server_onupdate": FetchedValue()},
+    )
     start_time: datetime = Field(index=True)
     end_time: datetime = Field(index=True)
-    purpose: str = Field(max_length=500)
+    # Free-text columns are TEXT so long values are TOASTed out of the main row; lengths are enforced by the schemas
+    purpose: str = Field(sa_type=Text)
     course: Optional[str] = Field(default=None, max_length=100)
     project: Optional[str] = Field(default=None, max_length=200)
     jsa_pdf: str = Field(max_length=500)  # Mandatory JSA file path
-    status: LoanStatus = Field(default=LoanStatus.pending, index=True)
-    approved_by: Optional[str] = Field(default=None, foreign_key="users.id")
-    head_approved_by: Optional[str] = Field(default=None, foreign_key="users.id")
-    checkout_by: Optional[str] = Field(default=None, foreign_key="users.id")
-    checkin_by: Optional[str] = Field(default=None, foreign_key="users.id")
-    checkout_condition: Optional[str] = Field(default=None, max_length=1000)
-    checkin_condition: Optional[str] = Field(default=None, max_length=1000)
+    status: LoanStatus = Field(
+        default=LoanStatus.pending, sa_column=Column(_pg_enum(LoanStatus, "loan_status"), nullable=False, index=True)
+    )
+    approved_by: Optional[uuid.UUID] = Field(default=None, foreign_key="users.id")
+    head_approved_by: Optional[uuid.UUID] = Field(default=None, foreign_key="users.id")
+    checkout_by: Optional[uuid.UUID] = Field(default=None, foreign_key="users.id")
+    checkin_by: Optional[uuid.UUID] = Field(default=None, foreign_key="users.id")
+    checkout_condition: Optional[str] = Field(default=None, sa_type=Text)
+    checkin_condition: Optional[str] = Field(default=None, sa_type=Text)
     photo_before: Optional[str] = Field(default=None, max_length=500)
     photo_after: Optional[str] = Field(default=None, max_length=500)
     late_minutes: int = Field(default=0)
-    damage_report: Optional[str] = Field(default=None, max_length=2000)
-    damage_cost: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=12)
-    notes: Optional[str] = Field(default=None, max_length=1000)
-    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
-    updated_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
+    damage_report: Optional[str] = Field(default=None, sa_type=Text)
+    damage_cost: Optional[Decimal] = Field(
+        default=None, decimal_places=2, max_digits=12, sa_column=Column("damage_cost_cents", _Cents)
+    )
+    notes: Optional[str] = Field(default=None, sa_type=Text)
+    created_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
+    )
+    updated_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()),
+    )
 
     # Relationships
-    equipment: "Equipment" = Relationship(back_populates="loans")
+    # All lazy="raise" to avoid N+1 queries on loan lists: pass selectinload(Loan.borrower) etc. explicitly
+    equipment: "Equipment" = Relationship(back_populates="loans", sa_relationship_kwargs={"lazy": "raise"})
     borrower: "User" = Relationship(
-        back_populates="loans_as_borrower", sa_relationship_kwargs={"foreign_keys": "[Loan.borrower_id]"}
+        back_populates="loans_as_borrower",
+        sa_relationship_kwargs={"foreign_keys": "[Loan.borrower_id]", "lazy": "raise"},
     )
     supervisor: Optional["User"] = Relationship(
-        back_populates="loans_as_supervisor", sa_relationship_kwargs={"foreign_keys": "[Loan.supervisor_id]"}
+        back_populates="loans_as_supervisor",
+        sa_relationship_kwargs={"foreign_keys": "[Loan.supervisor_id]", "lazy": "raise"},
     )
-    lab: "Lab" = Relationship(back_populates="loans")
+    lab: "Lab" = Relationship(back_populates="loans", sa_relationship_kwargs={"lazy": "raise"})
+
+
+# btree_gist provides the GiST "=" operator on uuid used by the loan_no_overlap exclusion constraint
+event.listen(
+    SQLModel.metadata.tables["loans"],
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
+
+# Keep loans.lab_id equal to the lab of the borrowed equipment, whatever the application sets it to
+event.listen(
+    SQLModel.metadata.tables["loans"],
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION loans_sync_lab_id() RETURNS trigger AS $$
+        BEGIN
+            SELECT lab_id INTO NEW.lab_id FROM equipment WHERE id = NEW.equipment_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE OR REPLACE TRIGGER loans_sync_lab_id
+            BEFORE INSERT OR UPDATE OF equipment_id, lab_id ON loans
+            FOR EACH ROW EXECUTE FUNCTION loans_sync_lab_id();
+
+        CREATE OR REPLACE FUNCTION equipment_propagate_lab_id() RETURNS trigger AS $$
+        BEGIN
+            UPDATE loans SET lab_id = NEW.lab_id WHERE equipment_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE OR REPLACE TRIGGER equipment_propagate_lab_id
+            AFTER UPDATE OF lab_id ON equipment
+            FOR EACH ROW WHEN (OLD.lab_id IS DISTINCT FROM NEW.lab_id)
+            EXECUTE FUNCTION equipment_propagate_lab_id();
+        """
+    ).execute_if(dialect="postgresql"),
+)
 
 
 class Maintenance(SQLModel, table=True):
     __tablename__ = "maintenance"  # type: ignore[assignment]
 
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, max_length=36)
-    equipment_id: str = Field(foreign_key="equipment.id", index=True)
-    type: MaintenanceType = Field(index=True)
+    id: Optional[uuid.UUID] = Field(default_factory=_uuid7, primary_key=True)
+    equipment_id: uuid.UUID = Field(foreign_key="equipment.id", index=True)
+    type: MaintenanceType = Field(
+        sa_column=Column(_pg_enum(MaintenanceType, "maintenance_type"), nullable=False, index=True)
+    )
     date: datetime = Field(index=True)
     notes: str = Field(max_length=2000)
     doc_pdf: Optional[str] = Field(default=None, max_length=500)
-    cost: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=12)
+    cost: Optional[Decimal] = Field(
+        default=None, decimal_places=2, max_digits=12, sa_column=Column("cost_cents", _Cents)
+    )
     performed_by: Optional[str] = Field(default=None, max_length=200)
     created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column=Column(DateTime(timezone=True), server_default=func.now())
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
     )
 
     # Relationships
-    equipment: "Equipment" = Relationship(back_populates="maintenance_records")
+    equipment: "Equipment" = Relationship(
+        back_populates="maintenance_records", sa_relationship_kwargs={"lazy": "raise"}
+    )
 
 
 class Notification(SQLModel, table=True):
     __tablename__ = "notifications"  # type: ignore[assignment]
+    __table_args__ = (
+        # Inbox ("latest N for user"): covering, so the listing is an index-only scan
+        Index("ix_notif_user_created", "user_id", text("created_at DESC"), postgresql_include=["is_read", "title"]),
+        Index("ix_notif_user_unread", "user_id", "is_read", text("created_at DESC")),
+    )
 
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, max_length=36)
-    user_id: str = Field(foreign_key="users.id", index=True)
-    type: NotificationType = Field(index=True)
+    id: Optional[uuid.UUID] = Field(default_factory=_uuid7, primary_key=True)
+    user_id: uuid.UUID = Field(foreign_key="users.id")  # Indexed via ix_notif_user_created
+    type: NotificationType = Field(
+        sa_column=Column(_pg_enum(NotificationType, "notification_type"), nullable=False, index=True)
+    )
     title: str = Field(max_length=200)
     message: str = Field(max_length=1000)
-    payload: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    payload: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
     is_read: bool = Field(default=False, index=True)
-    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now(), index=True))
+    created_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
+    )
 
     # Relationships
-    user: "User" = Relationship(back_populates="notifications")
+    user: "User" = Relationship(back_populates="notifications", sa_relationship_kwargs={"lazy": "raise"})
 
 
 class AuditLog(SQLModel, table=True):
     __tablename__ = "audit_logs"  # type: ignore[assignment]
+    # Range-partitioned by month on created_at (partitions are created in app.database), which
+    # requires the partition key to be part of the primary key
+    __table_args__ = (
+        PrimaryKeyConstraint("created_at", "id"),
+        # The primary key leads with created_at, so lookups by id alone need their own index
+        Index("ix_audit_logs_id", "id"),
+        Index("ix_audit_detail_gin", "detail", postgresql_using="gin", postgresql_ops={"detail": "jsonb_path_ops"}),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, max_length=36)
-    user_id: Optional[str] = Field(default=None, foreign_key="users.id", index=True)
+    id: Optional[uuid.UUID] = Field(default_factory=_uuid7, primary_key=True)
+    user_id: Optional[uuid.UUID] = Field(default=None, foreign_key="users.id", index=True)
     action: str = Field(max_length=100, index=True)
     entity: str = Field(max_length=100, index=True)
-    entity_id: Optional[str] = Field(default=None, max_length=36, index=True)
-    detail: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    ip_address: Optional[str] = Field(default=None, max_length=45)
+    entity_id: Optional[uuid.UUID] = Field(default=None, index=True)
+    detail: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
+    ip_address: Optional[IPvAnyAddress] = Field(default=None, sa_type=_IPAddress)
     user_agent: Optional[str] = Field(default=None, max_length=500)
-    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now(), index=True))
+    created_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), primary_key=True, server_default=func.now()),
+    )
 
     # Relationships
-    user: Optional["User"] = Relationship(back_populates="audit_logs")
+    user: Optional["User"] = Relationship(sa_relationship_kwargs={"lazy": "raise"})
 
 
 class Setting(SQLModel, table=True):
     __tablename__ = "settings"  # type: ignore[assignment]
+    __mapper_args__ = {"eager_defaults": True}
 
     key: str = Field(primary_key=True, max_length=100)
-    value: Dict[str, Any] = Field(sa_column=Column(JSON))
-    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
-    updated_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
+    value: Dict[str, Any] = Field(sa_column=Column(JSONB))
+    created_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
+    )
+    updated_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()),
+    )
 
 
 class TrainingCertificate(SQLModel, table=True):
     __tablename__ = "training_certificates"  # type: ignore[assignment]
 
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, max_length=36)
-    user_id: str = Field(foreign_key="users.id", index=True)
-    equipment_id: str = Field(foreign_key="equipment.id", index=True)
-    issued_at: datetime = Field(sa_column=Column(DateTime(timezone=True), server_default=func.now()))
+    id: Optional[uuid.UUID] = Field(default_factory=_uuid7, primary_key=True)
+    user_id: uuid.UUID = Field(foreign_key="users.id", index=True)
+    equipment_id: uuid.UUID = Field(foreign_key="equipment.id", index=True)
+    issued_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
+    )
     expires_at: Optional[datetime] = Field(default=None)
     certificate_pdf: Optional[str] = Field(default=None, max_length=500)
     created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column=Column(DateTime(timezone=True), server_default=func.now())
+        default_factory=_utcnow,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
     )
 
     # Relationships
-    user: "User" = Relationship(back_populates="training_certificates")
-    equipment: "Equipment" = Relationship(back_populates="training_certificates")
+    user: "User" = Relationship(sa_relationship_kwargs={"lazy": "raise"})
+    equipment: "Equipment" = Relationship(sa_relationship_kwargs={"lazy": "raise"})
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
@@ -262,13 +501,13 @@ class UserCreate(SQLModel, table=False):
     npm: Optional[str] = Field(default=None, max_length=20)
     nip: Optional[str] = Field(default=None, max_length=30)
     phone: Optional[str] = Field(default=None, max_length=20)
-    lab_id: Optional[str] = Field(default=None, max_length=36)
+    lab_id: Optional[uuid.UUID] = Field(default=None)
 
 
 class UserUpdate(SQLModel, table=False):
     name: Optional[str] = Field(default=None, max_length=100)
     phone: Optional[str] = Field(default=None, max_length=20)
-    lab_id: Optional[str] = Field(default=None, max_length=36)
+    lab_id: Optional[uuid.UUID] = Field(default=None)
     is_active: Optional[bool] = Field(default=None)
 
 
@@ -281,7 +520,7 @@ class StudentRegister(SQLModel, table=False):
 
 
 class PasswordReset(SQLModel, table=False):
-    user_id: str = Field(max_length=36)
+    user_id: uuid.UUID
     new_password: str = Field(min_length=8, max_length=128)
 
 
@@ -291,7 +530,7 @@ class LabCreate(SQLModel, table=False):
     location: str = Field(max_length=200)
     capacity: int = Field(ge=1)
     operating_hours: Dict[str, Any] = Field(default={})
-    head_id: Optional[str] = Field(default=None, max_length=36)
+    head_id: Optional[uuid.UUID] = Field(default=None)
     contact_person: str = Field(max_length=100)
     contact_email: str = Field(max_length=255)
     description: str = Field(default="", max_length=2000)
@@ -302,14 +541,14 @@ class LabUpdate(SQLModel, table=False):
     location: Optional[str] = Field(default=None, max_length=200)
     capacity: Optional[int] = Field(default=None, ge=1)
     operating_hours: Optional[Dict[str, Any]] = Field(default=None)
-    head_id: Optional[str] = Field(default=None, max_length=36)
+    head_id: Optional[uuid.UUID] = Field(default=None)
     contact_person: Optional[str] = Field(default=None, max_length=100)
     contact_email: Optional[str] = Field(default=None, max_length=255)
     description: Optional[str] = Field(default=None, max_length=2000)
 
 
 class EquipmentCreate(SQLModel, table=False):
-    lab_id: str = Field(max_length=36)
+    lab_id: uuid.UUID
     code: str = Field(max_length=50)
     name: str = Field(max_length=200)
     brand: Optional[str] = Field(default=None, max_length=100)
@@ -332,8 +571,8 @@ class EquipmentUpdate(SQLModel, table=False):
 
 
 class LoanCreate(SQLModel, table=False):
-    equipment_id: str = Field(max_length=36)
-    supervisor_id: Optional[str] = Field(default=None, max_length=36)
+    equipment_id: uuid.UUID
+    supervisor_id: Optional[uuid.UUID] = Field(default=None)
     start_time: datetime
     end_time: datetime
     purpose: str = Field(max_length=500)
@@ -351,7 +590,7 @@ class LoanUpdate(SQLModel, table=False):
 
 
 class MaintenanceCreate(SQLModel, table=False):
-    equipment_id: str = Field(max_length=36)
+    equipment_id: uuid.UUID
     type: MaintenanceType
     date: datetime
     notes: str = Field(max_length=2000)
@@ -360,7 +599,7 @@ class MaintenanceCreate(SQLModel, table=False):
 
 
 class NotificationCreate(SQLModel, table=False):
-    user_id: str = Field(max_length=36)
+    user_id: uuid.UUID
     type: NotificationType
     title: str = Field(max_length=200)
     message: str = Field(max_length=1000)
@@ -368,12 +607,12 @@ class NotificationCreate(SQLModel, table=False):
 
 
 class AuditLogCreate(SQLModel, table=False):
-    user_id: Optional[str] = Field(default=None, max_length=36)
+    user_id: Optional[uuid.UUID] = Field(default=None)
     action: str = Field(max_length=100)
     entity: str = Field(max_length=100)
-    entity_id: Optional[str] = Field(default=None, max_length=36)
+    entity_id: Optional[uuid.UUID] = Field(default=None)
     detail: Dict[str, Any] = Field(default={})
-    ip_address: Optional[str] = Field(default=None, max_length=45)
+    ip_address: Optional[IPvAnyAddress] = Field(default=None)
     user_agent: Optional[str] = Field(default=None, max_length=500)
 
 
@@ -382,44 +621,85 @@ class SettingUpdate(SQLModel, table=False):
 
 
 class TrainingCertificateCreate(SQLModel, table=False):
-    user_id: str = Field(max_length=36)
-    equipment_id: str = Field(max_length=36)
+    user_id: uuid.UUID
+    equipment_id: uuid.UUID
     expires_at: Optional[datetime] = Field(default=None)
 
 
 # Response schemas for API endpoints
+# Rows loaded from the database are already valid, so from_model() builds responses with model_construct()
+# (no validation pass) and the *_LIST_ADAPTER type adapters below serialize whole lists in one call.
+# Responses are frozen so unvalidated instances cannot be modified afterwards. Frozen does not mean hashable:
+# LabResponse and EquipmentResponse hold dict fields, so responses must not be used as cache or set keys.
 class UserResponse(SQLModel, table=False):
-    id: str
+    model_config = ConfigDict(frozen=True)  # type: ignore[assignment]
+
+    id: uuid.UUID
     name: str
     email: str
     role: UserRole
     is_active: bool
     is_verified: bool
-    npm: Optional[str]
-    nip: Optional[str]
+    npm: Optional[str] = None  # Only set for mahasiswa
+    nip: Optional[str] = None  # Only set for staff
     phone: Optional[str]
-    lab_id: Optional[str]
+    lab_id: Optional[uuid.UUID]
     created_at: str  # ISO format
-    updated_at: str  # ISO format
+
+    @classmethod
+    def from_model(cls, user: User) -> "UserResponse":
+        return cls.model_construct(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            role=user.role,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            npm=user.npm,
+            nip=user.nip,
+            phone=user.phone,
+            lab_id=user.lab_id,
+            created_at=user.created_at.isoformat(),
+        )
 
 
 class LabResponse(SQLModel, table=False):
-    id: str
+    model_config = ConfigDict(frozen=True)  # type: ignore[assignment]
+
+    id: uuid.UUID
     code: str
     name: str
     location: str
     capacity: int
     operating_hours: Dict[str, Any]
-    head_id: Optional[str]
+    head_id: Optional[uuid.UUID]
     contact_person: str
     contact_email: str
     description: str
     created_at: str  # ISO format
 
+    @classmethod
+    def from_model(cls, lab: Lab) -> "LabResponse":
+        return cls.model_construct(
+            id=lab.id,
+            code=lab.code,
+            name=lab.name,
+            location=lab.location,
+            capacity=lab.capacity,
+            operating_hours=lab.operating_hours,
+            head_id=lab.head_id,
+            contact_person=lab.contact_person,
+            contact_email=lab.contact_email,
+            description=lab.description,
+            created_at=lab.created_at.isoformat(),
+        )
+
 
 class EquipmentResponse(SQLModel, table=False):
-    id: str
-    lab_id: str
+    model_config = ConfigDict(frozen=True)  # type: ignore[assignment]
+
+    id: uuid.UUID
+    lab_id: uuid.UUID
     code: str
     name: str
     brand: Optional[str]
@@ -431,18 +711,63 @@ class EquipmentResponse(SQLModel, table=False):
     calibration_due_date: Optional[str]  # ISO date format
     created_at: str  # ISO format
 
+    @classmethod
+    def from_model(cls, equipment: Equipment) -> "EquipmentResponse":
+        calibration_due_date = equipment.calibration_due_date
+        return cls.model_construct(
+            id=equipment.id,
+            lab_id=equipment.lab_id,
+            code=equipment.code,
+            name=equipment.name,
+            brand=equipment.brand,
+            model=equipment.model,
+            serial_no=equipment.serial_no,
+            specification=equipment.specification,
+            status=equipment.status,
+            needs_head_approval=equipment.needs_head_approval,
+            calibration_due_date=calibration_due_date.isoformat() if calibration_due_date is not None else None,
+            created_at=equipment.created_at.isoformat(),
+        )
+
 
 class LoanResponse(SQLModel, table=False):
-    id: str
-    equipment_id: str
-    borrower_id: str
-    supervisor_id: Optional[str]
-    lab_id: str
-    start_time: str  # ISO format
-    end_time: str  # ISO format
+    model_config = ConfigDict(frozen=True)  # type: ignore[assignment]
+
+    id: uuid.UUID
+    equipment_id: uuid.UUID
+    borrower_id: uuid.UUID
+    supervisor_id: Optional[uuid.UUID]
+    lab_id: uuid.UUID
+    start_time: str  # ISO format, always with microseconds
+    end_time: str  # ISO format, always with microseconds
     purpose: str
     course: Optional[str]
     project: Optional[str]
     status: LoanStatus
     late_minutes: int
-    created_at: str  # ISO format
+    created_at: str  # ISO format, always with microseconds
+
+    @classmethod
+    def from_model(cls, loan: Loan) -> "LoanResponse":
+        return cls.model_construct(
+            id=loan.id,
+            equipment_id=loan.equipment_id,
+            borrower_id=loan.borrower_id,
+            supervisor_id=loan.supervisor_id,
+            lab_id=loan.lab_id,
+            # Same text as app.loan_service produces with to_char, which cannot drop zero microseconds
+            start_time=loan.start_time.isoformat(timespec="microseconds"),
+            end_time=loan.end_time.isoformat(timespec="microseconds"),
+            purpose=loan.purpose,
+            course=loan.course,
+            project=loan.project,
+            status=loan.status,
+            late_minutes=loan.late_minutes,
+            created_at=loan.created_at.isoformat(timespec="microseconds"),
+        )
+
+
+USER_RESPONSE_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+LAB_RESPONSE_LIST_ADAPTER = TypeAdapter(List[LabResponse])
+EQUIPMENT_RESPONSE_LIST_ADAPTER = TypeAdapter(List[EquipmentResponse])
+LOAN_RESPONSE_LIST_ADAPTER = TypeAdapter(List[LoanResponse])
@@ -0,0 +1,103 @@
+"""Cached access to the settings key/value table.
+
+Settings are read on most requests but written rarely, so parsed values are kept in-process for a short TTL.
+Writes invalidate the local cache and NOTIFY other workers, whose listener task drops their copy too.
+"""
+
+import asyncio
+import time
+from logging import getLogger
+from typing import Any, Dict, Optional
+
+import asyncpg
+from sqlalchemy.engine import make_url
+from sqlmodel import text
+
+from app.database import DATABASE_URL, get_session
+from app.models import Setting
+
+logger = getLogger(__name__)
+
+SETTINGS_CACHE_TTL_SECONDS = 30.0
+SETTINGS_CHANGED_CHANNEL = "settings_changed"
+
+# key -> (expires_at on the monotonic clock, value or None when the key does not exist)
+_cache: Dict[str, tuple[float, Optional[Dict[str, Any]]]] = {}
+
+# asyncpg only understands plain postgresql:// DSNs, without a SQLAlchemy driver suffix
+_LISTENER_DSN = make_url(DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+def get_setting(key: str) -> Optional[Dict[str, Any]]:
+    """Return the value of a setting, or None if it does not exist.
+
+    The returned dict is shared with other callers until the cache entry expires - treat it as read-only.
+    """
+    now = time.monotonic()
+    cached = _cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    with get_session() as session:
+        setting = session.get(Setting, key)
+        value = setting.value if setting is not None else None
+    _cache[key] = (now + SETTINGS_CACHE_TTL_SECONDS, value)
+    return value
+
+
+def set_setting(key: str, value: Dict[str, Any]) -> Setting:
+    with get_session() as session:
+        setting = session.get(Setting, key)
+        if setting is None:
+            setting = Setting(key=key, value=value)
+        else:
+            setting.value = value
+        session.add(setting)
+        # Delivered to listeners only when the transaction commits
+        session.connection().execute(
+            text("SELECT pg_notify(:channel, :key)"), {"channel": SETTINGS_CHANGED_CHANNEL, "key": key}
+        )
+        session.commit()
+        session.refresh(setting)
+    invalidate_setting_cache(key)
+    return setting
+
+
+def invalidate_setting_cache(key: Optional[str] = None) -> None:
+    """Drop one cached setting, or all of them when no key is given."""
+    if key is None:
+        _cache.clear()
+    else:
+        _cache.pop(key, None)
+
+
+def _on_setting_changed(_connection: Any, _pid: int, _channel: str, key: str) -> None:
+    invalidate_setting_cache(key)
+
+
+async def listen_for_setting_changes() -> None:
+    """Background task: LISTEN for setting writes from other workers and invalidate the local cache.
+
+    Reconnects when the connection drops; the TTL bounds staleness while disconnected.
+    """
+    while True:
+        try:
+            connection = await asyncpg.connect(_LISTENER_DSN)
+        except Exception:
+            logger.exception("Could not connect to listen for setting changes, retrying")
+            await asyncio.sleep(SETTINGS_CACHE_TTL_SECONDS)
+            continue
+
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _connection: closed.set())
+        try:
+            await connection.add_listener(SETTINGS_CHANGED_CHANNEL, _on_setting_changed)
+            # Notifications may have been missed while disconnected
+            invalidate_setting_cache()
+            await closed.wait()
+            logger.warning("Settings listener connection closed, reconnecting")
+        except Exception:
+            logger.exception("Settings listener failed, reconnecting")
+            await asyncio.sleep(SETTINGS_CACHE_TTL_SECONDS)
+        finally:
+            await connection.close()
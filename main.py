@@ -1,7 +1,9 @@
 import logging
 import os
+from app.database import maintain_audit_log_partitions
+from app.settings_service import listen_for_setting_changes
 from app.startup import startup
-from nicegui import app, ui
+from nicegui import app, background_tasks, ui
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -31,6 +33,11 @@ logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.WARNING)
 
 app.on_startup(startup)
 
+# Keep this worker's settings cache in sync with writes made by other workers
+app.on_startup(lambda: background_tasks.create(listen_for_setting_changes(), name="settings_listener"))
+# Precreate audit_logs partitions for upcoming months without relying on restarts
+app.on_startup(lambda: background_tasks.create(maintain_audit_log_partitions(), name="audit_log_partitions"))
+
 # Add security headers middleware
 app.add_middleware(SecurityHeadersMiddleware)
 
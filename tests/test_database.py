@@ -0,0 +1,22 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlmodel import Session
+
+from app.database import ENGINE, reset_db
+from app.models import AuditLog
+
+
+@pytest.fixture()
+def clean_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+def test_backdated_audit_log_lands_in_a_past_partition(clean_db):
+    with Session(ENGINE) as session:
+        session.add(
+            AuditLog(action="import", entity="loan", created_at=datetime.now(timezone.utc) - timedelta(days=40))
+        )
+        session.commit()
@@ -0,0 +1,154 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from app.database import ASYNC_SESSION_MAKER, ENGINE, reset_db
+from app.loan_service import list_loan_responses
+from app.models import Equipment, Lab, Loan, LoanResponse, LoanStatus, User, UserRole
+
+
+@pytest.fixture()
+def clean_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+@pytest.fixture()
+def sample_loan(clean_db):
+    with Session(ENGINE) as session:
+        lab = Lab(
+            code="KIM1",
+            name="Kimia Analitik",
+            location="Gedung A",
+            capacity=30,
+            contact_person="Laboran",
+            contact_email="lab@example.com",
+        )
+        borrower = User(name="Siti", email="siti@example.com", role=UserRole.mahasiswa, password_hash="x")
+        session.add(lab)
+        session.add(borrower)
+        session.flush()
+        assert lab.id is not None and borrower.id is not None
+        equipment = Equipment(lab_id=lab.id, code="SPC-01", name="Spectrophotometer")
+        session.add(equipment)
+        session.flush()
+        assert equipment.id is not None
+        # lab_id is left unset: the database trigger copies it from the equipment
+        loan = Loan(
+            equipment_id=equipment.id,
+            borrower_id=borrower.id,
+            start_time=datetime(2026, 1, 5, 8, 0),
+            end_time=datetime(2026, 1, 5, 12, 0),
+            purpose="Practicum",
+            jsa_pdf="jsa.pdf",
+            status=LoanStatus.approved,
+        )
+        session.add(loan)
+        session.commit()
+        session.refresh(loan)
+        return loan
+
+
+def test_loan_lab_id_is_set_from_equipment(sample_loan):
+    assert sample_loan.lab_id is not None
+
+
+def test_list_loan_responses_formats_timestamps_in_sql(sample_loan):
+    with Session(ENGINE) as session:
+        responses = list_loan_responses(session, lab_id=sample_loan.lab_id, status=LoanStatus.approved)
+
+    assert len(responses) == 1
+    response = responses[0]
+    assert response.id == sample_loan.id
+    assert response.start_time == "2026-01-05T08:00:00.000000"
+    assert response.end_time == "2026-01-05T12:00:00.000000"
+    assert datetime.fromisoformat(response.created_at) == sample_loan.created_at
+
+
+def test_list_loan_responses_match_from_model(sample_loan):
+    with Session(ENGINE) as session:
+        loan = session.get(Loan, sample_loan.id)
+        assert loan is not None
+        loan.start_time = datetime(2026, 1, 5, 8, 0, 0, 123456)
+        session.add(loan)
+        session.commit()
+        session.refresh(loan)
+
+        [response] = list_loan_responses(session, lab_id=loan.lab_id)
+
+        assert response.start_time == "2026-01-05T08:00:00.123456"
+        assert response == LoanResponse.from_model(loan)
+
+
+def test_list_loan_responses_filters_by_status(sample_loan):
+    with Session(ENGINE) as session:
+        assert list_loan_responses(session, status=LoanStatus.pending) == []
+
+
+def test_overlapping_active_loan_is_rejected(sample_loan):
+    with Session(ENGINE) as session:
+        session.add(
+            Loan(
+                equipment_id=sample_loan.equipment_id,
+                borrower_id=sample_loan.borrower_id,
+                start_time=datetime(2026, 1, 5, 11, 0),
+                end_time=datetime(2026, 1, 5, 13, 0),
+                purpose="Overlapping booking",
+                jsa_pdf="jsa.pdf",
+                status=LoanStatus.approved,
+            )
+        )
+        with pytest.raises(IntegrityError):
+            session.commit()
+
+
+def test_overlapping_pending_loan_is_allowed(sample_loan):
+    with Session(ENGINE) as session:
+        session.add(
+            Loan(
+                equipment_id=sample_loan.equipment_id,
+                borrower_id=sample_loan.borrower_id,
+                start_time=datetime(2026, 1, 5, 11, 0),
+                end_time=datetime(2026, 1, 5, 13, 0),
+                purpose="Overlapping request",
+                jsa_pdf="jsa.pdf",
+                status=LoanStatus.pending,
+            )
+        )
+        session.commit()
+
+        assert len(list_loan_responses(session, status=LoanStatus.pending)) == 1
+
+
+@pytest.mark.parametrize("end_time", [datetime(2026, 2, 1, 8, 0), datetime(2026, 2, 1, 7, 0)])
+def test_loan_ending_before_it_starts_is_rejected(sample_loan, end_time):
+    with Session(ENGINE) as session:
+        session.add(
+            Loan(
+                equipment_id=sample_loan.equipment_id,
+                borrower_id=sample_loan.borrower_id,
+                start_time=datetime(2026, 2, 1, 8, 0),
+                end_time=end_time,
+                purpose="Backwards booking",
+                jsa_pdf="jsa.pdf",
+            )
+        )
+        with pytest.raises(IntegrityError, match="ck_loan_time_order"):
+            session.commit()
+
+
+async def test_loan_is_readable_after_async_commit(sample_loan):
+    async with ASYNC_SESSION_MAKER() as session:
+        loan = await session.get(Loan, sample_loan.id)
+        assert loan is not None
+        loan.notes = "Returned clean"
+        session.add(loan)
+        await session.commit()
+
+        # Server-side values come back via RETURNING, so no lazy refresh (MissingGreenlet) is needed
+        assert loan.lab_id == sample_loan.lab_id
+        assert loan.updated_at >= sample_loan.updated_at
+        assert LoanResponse.from_model(loan).id == sample_loan.id
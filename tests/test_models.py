@@ -0,0 +1,147 @@
+"""Database-free checks for model definitions."""
+
+import ipaddress
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import configure_mappers
+from sqlmodel import SQLModel
+
+from app.models import (
+    LOAN_RESPONSE_LIST_ADAPTER,
+    AuditLog,
+    AuditLogCreate,
+    Loan,
+    LoanResponse,
+    LoanStatus,
+    LoanUpdate,
+    Maintenance,
+    MaintenanceCreate,
+    MaintenanceType,
+    _Cents,
+    _IPAddress,
+    _uuid7,
+)
+
+
+def _loan() -> Loan:
+    return Loan(
+        id=_uuid7(),
+        equipment_id=_uuid7(),
+        borrower_id=_uuid7(),
+        lab_id=_uuid7(),
+        start_time=datetime(2026, 1, 5, 8, 0),
+        end_time=datetime(2026, 1, 5, 12, 0),
+        purpose="Titration practicum",
+        jsa_pdf="jsa.pdf",
+        status=LoanStatus.approved,
+    )
+
+
+def test_uuid7_is_versioned_and_time_ordered():
+    ids = [_uuid7() for _ in range(100)]
+
+    assert all(isinstance(value, uuid.UUID) for value in ids)
+    assert all(value.version == 7 for value in ids)
+    assert all(value.variant == uuid.RFC_4122 for value in ids)
+    # The leading 48 bits are a millisecond timestamp, so they never go backwards
+    timestamps = [value.int >> 80 for value in ids]
+    assert timestamps == sorted(timestamps)
+
+
+def test_mappers_configure():
+    configure_mappers()
+
+
+def test_models_with_server_updated_columns_fetch_them_eagerly():
+    configure_mappers()
+    for mapper in SQLModel._sa_registry.mappers:
+        if any(c.onupdate is not None or c.server_onupdate is not None for c in mapper.local_table.columns):
+            assert mapper.eager_defaults is True, mapper.class_.__name__
+
+
+def test_relationships_raise_on_lazy_load():
+    configure_mappers()
+    for mapper in SQLModel._sa_registry.mappers:
+        for relationship in mapper.relationships:
+            assert relationship.lazy == "raise", f"{mapper.class_.__name__}.{relationship.key}"
+
+
+def test_money_is_stored_as_cents():
+    cents = _Cents()
+    dialect = postgresql.dialect()
+
+    assert cents.process_bind_param(Decimal("12.345"), dialect) == 1235
+    assert cents.process_result_value(1235, dialect) == Decimal("12.35")
+    assert cents.process_bind_param(None, dialect) is None
+    assert cents.process_result_value(None, dialect) is None
+
+
+def test_maintenance_cost_is_kept_when_built_from_create_schema():
+    create = MaintenanceCreate(
+        equipment_id=_uuid7(),
+        type=MaintenanceType.calibration,
+        date=datetime(2026, 1, 5, 9, 0),
+        notes="Annual calibration",
+        cost=Decimal("12.50"),
+    )
+
+    assert Maintenance.model_validate(create).cost == Decimal("12.50")
+    assert Maintenance(**create.model_dump()).cost == Decimal("12.50")
+
+
+def test_loan_damage_cost_is_kept_by_sqlmodel_update():
+    loan = _loan()
+    loan.sqlmodel_update(LoanUpdate(damage_cost=Decimal("75.00")).model_dump(exclude_unset=True))
+
+    assert loan.damage_cost == Decimal("75.00")
+
+
+def test_loan_response_from_model_serializes_without_validation():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    loan = Loan(
+        id=_uuid7(),
+        equipment_id=_uuid7(),
+        borrower_id=_uuid7(),
+        lab_id=_uuid7(),
+        start_time=datetime(2026, 1, 5, 8, 0),
+        end_time=datetime(2026, 1, 5, 12, 0),
+        purpose="Titration practicum",
+        jsa_pdf="jsa.pdf",
+        status=LoanStatus.approved,
+        created_at=created_at,
+    )
+
+    response = LoanResponse.from_model(loan)
+    # Always six fractional digits, matching the to_char patterns in app.loan_service
+    assert response.start_time == "2026-01-05T08:00:00.000000"
+    assert response.created_at == "2026-01-02T03:04:05.000000+00:00"
+
+    [dumped] = LOAN_RESPONSE_LIST_ADAPTER.dump_python([response], mode="json")
+    assert dumped["id"] == str(loan.id)
+    assert dumped["status"] == "approved"
+
+    with pytest.raises(ValidationError):
+        response.status = LoanStatus.returned
+
+
+def test_audit_log_ip_address_is_kept_when_built_from_create_schema():
+    create = AuditLogCreate(action="login", entity="user", ip_address=ipaddress.ip_address("10.0.0.7"))
+    audit_log = AuditLog.model_validate(create)
+
+    assert audit_log.ip_address == ipaddress.ip_address("10.0.0.7")
+    assert audit_log.created_at is not None
+
+
+def test_ip_address_is_stored_as_inet():
+    ip_type = _IPAddress()
+    dialect = postgresql.dialect()
+
+    assert ip_type.process_bind_param(ipaddress.ip_address("2001:db8::1"), dialect) == "2001:db8::1"
+    assert ip_type.process_result_value("10.0.0.7", dialect) == ipaddress.ip_address("10.0.0.7")
+    assert ip_type.process_bind_param(None, dialect) is None
+    assert ip_type.process_result_value(None, dialect) is None
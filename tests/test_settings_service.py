@@ -0,0 +1,32 @@
+import pytest
+
+from app.database import reset_db
+from app.settings_service import get_setting, invalidate_setting_cache, set_setting
+
+
+@pytest.fixture()
+def clean_db():
+    reset_db()
+    invalidate_setting_cache()
+    yield
+    reset_db()
+    invalidate_setting_cache()
+
+
+def test_missing_setting_is_none(clean_db):
+    assert get_setting("loan_policy") is None
+
+
+def test_set_setting_replaces_cached_value(clean_db):
+    set_setting("loan_policy", {"max_days": 7})
+    assert get_setting("loan_policy") == {"max_days": 7}
+
+    set_setting("loan_policy", {"max_days": 14})
+    assert get_setting("loan_policy") == {"max_days": 14}
+
+
+def test_cached_miss_is_invalidated_by_write(clean_db):
+    assert get_setting("loan_policy") is None
+
+    set_setting("loan_policy", {"max_days": 7})
+    assert get_setting("loan_policy") == {"max_days": 7}